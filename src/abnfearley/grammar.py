@@ -15,7 +15,8 @@ RuleCall -- call of grammar rule from within right-hand side
 """
 import os
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Union, Sequence, Mapping, Iterator
+from typing import (Optional, Union, Sequence, Mapping, Iterator,
+                    AbstractSet, Dict, FrozenSet, List, Set, Tuple)
 
 
 class Grammar(Mapping[str, 'GrammarElement']):
@@ -48,6 +49,8 @@ class Grammar(Mapping[str, 'GrammarElement']):
             self._imports = []
         for rule, rhs in self._rules.items():
             rhs.register(self, rule, self)
+        self._reachable: Dict[str, FrozenSet[int]] = {}
+        self._unproductive: Optional[Tuple[Tuple[Grammar, str], ...]] = None
 
     @property
     def name(self) -> str:
@@ -89,6 +92,115 @@ class Grammar(Mapping[str, 'GrammarElement']):
             length += len(grammar)
         return length
 
+    def _definitions(self) -> List[Tuple['Grammar', str,
+                                          'GrammarElement']]:
+        """Get all rule definitions, including shadowed ones.
+
+        Each definition is given as the grammar defining the rule, the
+        name of the rule, and its right-hand side. In contrast to
+        iterating over the grammar itself, this also contains rules of
+        imported grammars that are shadowed by rules of the same name,
+        since they may still be called from within the imported
+        grammars. Grammars imported more than once are only included
+        once.
+        """
+        definitions = []
+        seen: Set[int] = set()
+        pending: List[Grammar] = [self]
+        while pending:
+            grammar = pending.pop(0)
+            if id(grammar) in seen:
+                continue
+            seen.add(id(grammar))
+            for rule, rhs in grammar.rules.items():
+                definitions.append((grammar, rule, rhs))
+            pending.extend(grammar.imports)
+        return definitions
+
+    def _reached(self, start: str) -> FrozenSet[int]:
+        """Get ids of right-hand sides reachable from a start rule.
+
+        Calls are resolved in the grammar the calling right-hand side
+        is defined in, so that calls from within imported grammars are
+        not redirected to rules of the same name in this grammar.
+        """
+        if start not in self._reachable:
+            start_rhs = self[start]
+            reached = {id(start_rhs)}
+            pending = [start_rhs]
+            while pending:
+                rhs = pending.pop()
+                grammar = rhs.grammar
+                if grammar is None:
+                    raise ValueError(
+                        "Right-hand side of rule '{}' is not "
+                        "registered in a grammar.".format(rhs.rule))
+                for call in rhs.calls():
+                    called_rhs = grammar[call]
+                    if id(called_rhs) not in reached:
+                        reached.add(id(called_rhs))
+                        pending.append(called_rhs)
+            self._reachable[start] = frozenset(reached)
+        return self._reachable[start]
+
+    def reachable(self, start: str) -> Sequence[Tuple['Grammar', str]]:
+        """Get rules reachable from a start rule.
+
+        Argument:
+        start -- name of the rule parsing starts from
+
+        The rules are given as pairs of the defining grammar and the
+        name of the rule in the order of their definition. The start
+        rule itself is always contained in the result. The analysis is
+        done once per start rule and cached afterwards.
+        """
+        reached = self._reached(start)
+        return tuple((grammar, rule)
+                     for grammar, rule, rhs in self._definitions()
+                     if id(rhs) in reached)
+
+    def unreachable(self, start: str) -> Sequence[Tuple['Grammar', str]]:
+        """Get rules not reachable from a start rule.
+
+        Argument:
+        start -- name of the rule parsing starts from
+
+        The rules are given as pairs of the defining grammar and the
+        name of the rule in the order of their definition.
+        """
+        reached = self._reached(start)
+        return tuple((grammar, rule)
+                     for grammar, rule, rhs in self._definitions()
+                     if id(rhs) not in reached)
+
+    def unproductive(self) -> Sequence[Tuple['Grammar', str]]:
+        """Get rules that cannot produce any finite input.
+
+        The rules are given as pairs of the defining grammar and the
+        name of the rule in the order of their definition.
+
+        The productive rules are computed as a fixpoint: A rule is
+        productive if its right-hand side is productive given the rules
+        that are already known to be productive. The result is computed
+        once and cached afterwards.
+        """
+        if self._unproductive is None:
+            productive: Set[int] = set()
+            remaining = self._definitions()
+            changed = True
+            while changed:
+                changed = False
+                for grammar, rule, rhs in remaining:
+                    if rhs.is_productive(productive):
+                        productive.add(id(rhs))
+                        changed = True
+                remaining = [(grammar, rule, rhs)
+                             for grammar, rule, rhs in remaining
+                             if id(rhs) not in productive]
+            self._unproductive = tuple((grammar, rule)
+                                       for grammar, rule, rhs in remaining)
+        return self._unproductive
+
     def __eq__(self, other: object) -> bool:
         """Recursively check structural equality."""
         if not isinstance(other, Grammar):
@@ -210,6 +322,21 @@ class GrammarElement(metaclass=ABCMeta):
             return None
         return self._grammar
 
+    @abstractmethod
+    def calls(self) -> Iterator[str]:
+        """Iterate over names of rules called within element."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_productive(self, productive: AbstractSet[int]) -> bool:
+        """Check if element can produce a finite input.
+
+        Argument:
+        productive -- ids of right-hand sides of rules already known to
+                      be productive
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def __eq__(self, other: object) -> bool:
         """Recursively check strict structural equality."""
@@ -271,6 +398,16 @@ class Alternation(GrammarElement, Sequence[GrammarElement]):
         for element in self._elements:
             element.register(self, rule, grammar)
 
+    def calls(self) -> Iterator[str]:
+        """Iterate over names of rules called within alternatives."""
+        for element in self._elements:
+            yield from element.calls()
+
+    def is_productive(self, productive: AbstractSet[int]) -> bool:
+        """Check if at least one alternative is productive."""
+        return any(element.is_productive(productive)
+                   for element in self._elements)
+
     def __eq__(self, other: object) -> bool:
         """Recursively check strict structural equality."""
         if not isinstance(other, Alternation):
@@ -357,6 +494,16 @@ class Concatenation(GrammarElement, Sequence[GrammarElement]):
         for element in self._elements:
             element.register(self, rule, grammar)
 
+    def calls(self) -> Iterator[str]:
+        """Iterate over names of rules called within elements."""
+        for element in self._elements:
+            yield from element.calls()
+
+    def is_productive(self, productive: AbstractSet[int]) -> bool:
+        """Check if all concatenated elements are productive."""
+        return all(element.is_productive(productive)
+                   for element in self._elements)
+
     def __eq__(self, other: object) -> bool:
         """Recursively check strict structural equality."""
         if not isinstance(other, Concatenation):
@@ -452,6 +599,17 @@ class Repetition(GrammarElement):
         super().register(parent, rule, grammar)
         self._element.register(self, rule, grammar)
 
+    def calls(self) -> Iterator[str]:
+        """Iterate over names of rules called within repeated element."""
+        return self._element.calls()
+
+    def is_productive(self, productive: AbstractSet[int]) -> bool:
+        """Check if repetition can be empty or element is productive."""
+        if self._upper is not None and self._lower > self._upper:
+            return False
+        return (self._lower == 0 or
+                self._element.is_productive(productive))
+
     def __eq__(self, other: object) -> bool:
         """Recursively check strict structural equality."""
         if not isinstance(other, Repetition):
@@ -522,6 +680,14 @@ class LiteralString(GrammarElement):
         """Get case-sensitivity."""
         return self._case_sensitive
 
+    def calls(self) -> Iterator[str]:
+        """Iterate over no rules, since literals do not call any."""
+        return iter(())
+
+    def is_productive(self, productive: AbstractSet[int]) -> bool:
+        """Check productivity, which is trivial for literals."""
+        return True
+
     def __eq__(self, other: object) -> bool:
         """Recursively check strict structural equality."""
         if not isinstance(other, LiteralString):
@@ -603,6 +769,14 @@ class LiteralRange(GrammarElement):
         """Get code of last byte of matched range."""
         return self._last
 
+    def calls(self) -> Iterator[str]:
+        """Iterate over no rules, since literals do not call any."""
+        return iter(())
+
+    def is_productive(self, productive: AbstractSet[int]) -> bool:
+        """Check if range contains at least one byte."""
+        return self._first <= self._last
+
     def __eq__(self, other: object) -> bool:
         """Recursively check strict structural equality."""
         if not isinstance(other, LiteralRange):
@@ -666,6 +840,16 @@ class RuleCall(GrammarElement):
                 "Called rule '{}' not defined in grammar {}.".format(
                     self._call, grammar.name))
 
+    def calls(self) -> Iterator[str]:
+        """Iterate over the called rule."""
+        yield self._call
+
+    def is_productive(self, productive: AbstractSet[int]) -> bool:
+        """Check if called rule is known to be productive."""
+        if self._grammar is None:
+            return False
+        return id(self._grammar[self._call]) in productive
+
     def __eq__(self, other: object) -> bool:
         """Recursively check strict structural equality."""
         if not isinstance(other, RuleCall):